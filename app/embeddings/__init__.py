@@ -2,18 +2,20 @@
 
 from logging import getLogger
 
-from .embeddings import chunk_documents, cleanup_embeddings, embed_directory
+from .embeddings import chunk_documents, chunk_file, cleanup_embeddings, embed_directory
 from .embeddings import embed_documents, load_pdf_from_directory
 from .embeddings import load_pdf_from_directory_with_ocr, load_text_from_directory
 from .embeddings import update_metadata
+from .ingestion import embed_companies, list_source_files, load_manifest
 from .llm_chunker import chunk_from_directory_using_llm, chunk_using_llm
 from .pdf_loader import MyPDFLoader
 
 
-__all__ = ['chunk_documents', 'cleanup_embeddings', 'embed_directory',
+__all__ = ['chunk_documents', 'chunk_file', 'cleanup_embeddings', 'embed_directory',
            'embed_documents', 'load_pdf_from_directory',
            'load_pdf_from_directory_with_ocr', 'load_text_from_directory',
            'update_metadata',
+           'embed_companies', 'list_source_files', 'load_manifest',
            'chunk_from_directory_using_llm', 'chunk_using_llm',
            'MyPDFLoader']
 
@@ -12,7 +12,7 @@ from langchain_openai import OpenAIEmbeddings
 
 from app.config import LLM_API_KEY, LLM_API_URL, PDF_PROCESSING_LEVEL
 
-from .llm_chunker import chunk_from_directory_using_llm
+from .llm_chunker import chunk_from_directory_using_llm, chunk_using_llm
 from .pdf_loader import MyPDFLoader
 
 
@@ -90,6 +90,26 @@ def chunk_directory_pdf(directory, chunk_size, chunk_overlap):
                                                   chunk_overlap=chunk_overlap)
 
 
+def chunk_file(file_path, chunk_size, chunk_overlap, llm_client=None):
+    """Chunk a single text or PDF document, choosing the loader by its extension."""
+    file_path = str(file_path)
+    if not file_path.lower().endswith('.pdf'):
+        _logger.info(f'LOADING TEXT DOCUMENT "{file_path}"')
+        documents = TextLoader(file_path, encoding='utf-8').load()
+        return chunk_documents(documents, chunk_size, chunk_overlap)
+    match PDF_PROCESSING_LEVEL:
+        case 'LOW':
+            _logger.info(f'LOADING PDF DOCUMENT "{file_path}"')
+            documents = PyPDFLoader(file_path).load()
+        case 'MEDIUM':
+            _logger.info(f'LOADING PDF DOCUMENT WITH OCR "{file_path}"')
+            documents = MyPDFLoader(file_path).load()
+        case 'HIGH':
+            _logger.info(f'LOADING AND CHUNKING WITH LLM "{file_path}"')
+            return chunk_using_llm(file_path, llm_client, chunk_size, chunk_overlap)
+    return chunk_documents(documents, chunk_size, chunk_overlap)
+
+
 def embed_directory(directory, metadata, model_name,
                     chunk_size, chunk_overlap, db_host, db_port):
     """Embed documents from directory."""
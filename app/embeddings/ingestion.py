@@ -0,0 +1,159 @@
+"""Multi-company Document Ingestion module.
+
+    Loads, chunks and embeds the documents of several companies in a single process,
+    sharing the embedding, vectorstore and LLM clients, and running every file and
+    every embedding batch as a task on one shared worker pool.
+"""
+
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from logging import ERROR, INFO, getLogger
+from pathlib import Path
+from time import perf_counter
+
+from langchain_chroma import Chroma
+from langchain_openai import OpenAIEmbeddings
+from openai import OpenAI
+
+from app.config import LLM_API_KEY, LLM_API_URL, PDF_PROCESSING_LEVEL
+
+from .embeddings import chunk_file, update_metadata
+
+
+# Document files handled by the ingestion pipeline.
+SOURCE_GLOBS = ('**/*.txt', '**/*.md', '**/*.pdf')
+
+
+def load_manifest(manifest_path):
+    """Load ingestion manifest, a JSON object mapping company names to source folders.
+
+    Relative source folders are resolved against the manifest file folder.
+    Raises ValueError if the manifest is not a JSON object of strings.
+    """
+    with open(manifest_path, encoding='utf-8') as manifest_file:
+        manifest = json.load(manifest_file)
+    if not isinstance(manifest, dict) or not all(
+            isinstance(sources, str) for sources in manifest.values()):
+        raise ValueError(f'Manifest must be a JSON object mapping company names to'
+                         f' source folders: "{manifest_path}"')
+    manifest_dir = Path(manifest_path).parent
+    return {company: manifest_dir / sources for company, sources in manifest.items()}
+
+
+def list_source_files(directory, globs=SOURCE_GLOBS):
+    """List visible document files from directory, sorted and without duplicates."""
+    directory = Path(directory)
+    return sorted({path for glob in globs for path in directory.glob(glob)
+                   if path.is_file() and not any(
+                       part.startswith('.')
+                       for part in path.relative_to(directory).parts)})
+
+
+def embed_companies(manifest, model_name, chunk_size, chunk_overlap,
+                    db_host, db_port, max_workers=None):
+    """Embed documents from several companies in parallel, return per-company stats.
+
+    Every file is loaded and chunked as an independent task, and its chunks are
+    embedded as soon as it is done, in batches up to the vectorstore maximum size,
+    while the rest of the files are still being loaded.
+    """
+    # Shared clients for every task.
+    embedding_model = OpenAIEmbeddings(model=model_name,
+                                       api_key=LLM_API_KEY, base_url=LLM_API_URL)
+    vectorstore = Chroma(embedding_function=embedding_model,
+                         host=db_host, port=db_port)
+    batch_size = vectorstore._client.get_max_batch_size()
+    llm_client = (OpenAI(api_key=LLM_API_KEY, base_url=LLM_API_URL)
+                  if PDF_PROCESSING_LEVEL == 'HIGH' else None)
+    # Collect source files and initialize company stats.
+    files = {company: list_source_files(directory)
+             for company, directory in manifest.items()}
+    stats = {company: {'files': len(paths), 'errors': 0, 'chunks': 0,
+                       'load': 0.0, 'embed': 0.0, 'elapsed': 0.0}
+             for company, paths in files.items()}
+    # Pending tasks per company, both files and embedding batches.
+    pending = {company: len(paths) for company, paths in files.items()}
+    total_tasks = sum(pending.values())
+    done_tasks = 0
+    start = perf_counter()
+
+    def _chunk_task(company, file_path):
+        task_start = perf_counter()
+        file_chunks = chunk_file(file_path, chunk_size, chunk_overlap, llm_client)
+        file_chunks = update_metadata(file_chunks, {'company': company})
+        return file_chunks, perf_counter() - task_start
+
+    def _embed_task(batch):
+        task_start = perf_counter()
+        vectorstore.add_documents(batch)
+        return perf_counter() - task_start
+
+    def _progress(message, level=INFO):
+        _logger.log(level, f'[{done_tasks}/{total_tasks}] {message}'
+                           f' ({perf_counter() - start:.1f}s)')
+
+    def _company_done(company):
+        stats[company]['elapsed'] = perf_counter() - start
+        if stats[company]['chunks']:
+            _progress(f'EMBEDDED {stats[company]["chunks"]} CHUNKS FOR {company}')
+        elif stats[company]['files'] and (
+                stats[company]['errors'] == stats[company]['files']):
+            _progress(f'ALL {stats[company]["files"]} DOCUMENTS FAILED FOR {company}',
+                      ERROR)
+        else:
+            _progress(f'NO DOCUMENTS FOUND FOR {company}')
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix='Ingestion') as executor:
+        running = {}
+        try:
+            for company, paths in files.items():
+                for file_path in paths:
+                    running[executor.submit(_chunk_task, company, file_path)] = (
+                        company, file_path, None)
+                if not paths:
+                    _company_done(company)
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    company, file_path, batch = running.pop(future)
+                    pending[company] -= 1
+                    done_tasks += 1
+                    if batch is not None:  # Embedding batch task.
+                        try:
+                            stats[company]['embed'] += future.result()
+                            stats[company]['chunks'] += len(batch)
+                            _progress(f'EMBEDDED {len(batch)} CHUNKS'
+                                      f' FROM "{file_path}"')
+                        except Exception as ex:
+                            stats[company]['errors'] += 1
+                            _progress(f'ERROR EMBEDDING "{file_path}": {ex}', ERROR)
+                    else:  # File chunking task.
+                        try:
+                            file_chunks, seconds = future.result()
+                            stats[company]['load'] += seconds
+                            if not file_chunks:
+                                raise ValueError('no chunks extracted')
+                            _progress(f'CHUNKED "{file_path}"'
+                                      f' INTO {len(file_chunks)} CHUNKS')
+                            # Embed the file chunks while other files are loading.
+                            for index in range(0, len(file_chunks), batch_size):
+                                batch = file_chunks[index:index + batch_size]
+                                running[executor.submit(_embed_task, batch)] = (
+                                    company, file_path, batch)
+                                pending[company] += 1
+                                total_tasks += 1
+                        except Exception as ex:
+                            stats[company]['errors'] += 1
+                            _progress(f'ERROR PROCESSING "{file_path}": {ex}', ERROR)
+                    if not pending[company]:
+                        _company_done(company)
+        except BaseException:
+            # Drop queued tasks on interruption, only running ones are awaited.
+            executor.shutdown(cancel_futures=True)
+            raise
+    return stats
+
+
+# Instantiate local logger.
+_logger = getLogger(__name__)
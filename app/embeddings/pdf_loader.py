@@ -69,7 +69,8 @@ class MyPDFLoader(BaseLoader):
                     _logger.debug(f'OCR FROM PAGE {page_n} IMAGE {img_n} ({image.name}):'
                                   f'\n\t{text.strip()}')
                 if OCR_DEBUG:
-                    save_image_debug(img, img_enhanced, ocr_text, page_n, img_n)
+                    save_image_debug(img, img_enhanced, ocr_text,
+                                     Path(self.file_path).stem, page_n, img_n)
             except Exception as ex:
                 _logger.error(
                     f'OCR FAILED FOR PAGE {page_n} IMAGE {img_n} ({image.name}): {ex}')
@@ -96,11 +97,11 @@ def image_enhance(img):
     return img
 
 
-def save_image_debug(image, image_enhanced, text, page_num, img_num):
+def save_image_debug(image, image_enhanced, text, file_stem, page_num, img_num):
     """Save image and extracted text for debugging."""
     debug_dir = Path('./ocr_debug')
     debug_dir.mkdir(parents=True, exist_ok=True)
-    base_filename = debug_dir / f'page_{page_num}_img_{img_num}'
+    base_filename = debug_dir / f'{file_stem}_page_{page_num}_img_{img_num}'
     _logger.info(f'SAVING IMAGE TO {base_filename}.png')
     image.save(f'{base_filename}.png')
     image_enhanced.save(f'{base_filename}_enhanced.png')
@@ -0,0 +1,67 @@
+"""Multi-company Document Embedding tool."""
+
+import sys
+from argparse import ArgumentParser
+from logging import basicConfig, getLogger
+from pathlib import Path
+
+from app.config import CHROMADB_HOST, CHROMADB_PORT, EMBEDDING_MODEL, LOG_FORMAT
+from app.config import LOG_LEVEL, LOG_STYLE
+from app.embeddings import embed_companies, load_manifest
+
+
+# Setup the global logger.
+basicConfig(level=LOG_LEVEL, style=LOG_STYLE, format=LOG_FORMAT)
+
+# Instantiate local logger.
+_logger = getLogger(__name__)
+
+
+def print_summary(stats):
+    """Print per-company ingestion timing summary."""
+    print(f'{"COMPANY":<20} {"FILES":>6} {"ERRORS":>6} {"CHUNKS":>7}'
+          f' {"LOAD(s)":>8} {"EMBED(s)":>9} {"ELAPSED(s)":>11}')
+    for company, company_stats in stats.items():
+        print(f'{company:<20} {company_stats["files"]:>6} {company_stats["errors"]:>6}'
+              f' {company_stats["chunks"]:>7} {company_stats["load"]:>8.1f}'
+              f' {company_stats["embed"]:>9.1f} {company_stats["elapsed"]:>11.1f}')
+
+
+if __name__ == '__main__':
+    # Parse input arguments.
+    _logger.debug('PARSING ARGUMENTS')
+    parser = ArgumentParser(description='Generate RAG embeddings for many companies.')
+    parser.add_argument('-m', '--manifest', help='Companies manifest JSON file',
+                        default='policies/manifest.json')
+    parser.add_argument('-w', '--workers', help='Worker threads', default=None, type=int)
+    parser.add_argument('-z', '--size', help='Chunk size', default=1000, type=int)
+    parser.add_argument('-o', '--overlap', help='Chunk overlap', default=100, type=int)
+    args = parser.parse_args()
+    _logger.debug(f'PARSED ARGUMENTS: {vars(args)}')
+    # Sanitize input: Workers must be positive.
+    if args.workers is not None and args.workers < 1:
+        print(f'Worker threads must be at least 1: {args.workers}')
+        sys.exit(1)
+    # Sanitize input: Manifest must exist and every sources path must be a folder.
+    if not Path(args.manifest).is_file():
+        print(f'Manifest is not a valid file: "{args.manifest}"')
+        sys.exit(1)
+    try:
+        manifest = load_manifest(args.manifest)
+    except ValueError as ex:
+        print(f'Manifest is not valid: {ex}')
+        sys.exit(1)
+    if invalid := [str(path) for path in manifest.values() if not path.is_dir()]:
+        print(f'Sources paths are not valid folders: {invalid}')
+        sys.exit(1)
+    # Embed documents.
+    stats = embed_companies(manifest, model_name=EMBEDDING_MODEL,
+                            chunk_size=args.size, chunk_overlap=args.overlap,
+                            db_host=CHROMADB_HOST, db_port=CHROMADB_PORT,
+                            max_workers=args.workers)
+    print_summary(stats)
+    # Fail the run if any company could not be fully embedded.
+    if failed := [company for company, company_stats in stats.items()
+                  if company_stats['errors']]:
+        print(f'Companies with errors: {failed}')
+        sys.exit(1)